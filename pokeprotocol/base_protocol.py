@@ -3,43 +3,65 @@ base_protocol.py - Shared base class for PokeProtocol
 """
 
 import socket
-import json
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, Union
 from abc import ABC, abstractmethod
 
+from json_utils import dumps as json_dumps
+
+RECV_BUFFER_SIZE = 65536
+
+# Fixed ACK header, so an ACK is one bytes concat instead of a format + encode
+_ACK_BARE = b"message_type: ACK"
+_ACK_PREFIX = _ACK_BARE + b"\nack_number: "
+
 
 class PokeProtocolBase(ABC):
     """Base class for PokeProtocol with common functionality"""
     
-    def __init__(self, port: int = 5000):
+    __slots__ = ('port', 'rcvbuf_size', 'sndbuf_size', 'socket', 'connected',
+                 'sequence_number', 'peer_address', '_timeout', '_rx_buf', '_rx_view')
+    
+    def __init__(self, port: int = 5000, rcvbuf_size: Optional[int] = None,
+                 sndbuf_size: Optional[int] = None):
         self.port = port
+        self.rcvbuf_size = rcvbuf_size  # None keeps the kernel default (and autotuning)
+        self.sndbuf_size = sndbuf_size
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.sequence_number = 0
         self.peer_address: Optional[Tuple[str, int]] = None
+        self._timeout: Optional[float] = None  # last value passed to settimeout()
+        # Reused by every receive so steady-state reads allocate nothing for the raw datagram
+        self._rx_buf = bytearray(RECV_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
         
     def create_socket(self) -> bool:
         """Create and configure UDP socket"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._timeout = None
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Buffer sizes are tuned once here, never on the send/receive path
+            self._grow_buffer(socket.SO_RCVBUF, self.rcvbuf_size)
+            self._grow_buffer(socket.SO_SNDBUF, self.sndbuf_size)
             return True
         except Exception as e:
             print(f"Failed to create socket: {e}")
             return False
     
-    def parse_message(self, data: bytes) -> Dict[str, str]:
+    def _grow_buffer(self, option: int, size: Optional[int]):
+        """Raise a socket buffer to `size` if asked; never shrink it below the kernel's current value"""
+        if size is not None and size > self.socket.getsockopt(socket.SOL_SOCKET, option):
+            self.socket.setsockopt(socket.SOL_SOCKET, option, size)
+    
+    def parse_message(self, data: Union[bytes, memoryview]) -> Dict[str, str]:
         """Parse key:value message format"""
         message = {}
-        try:
-            text = data.decode('utf-8').strip()
-            lines = text.split('\n')
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    message[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"Failed to parse message: {e}")
+        # errors='replace' means a corrupt datagram can't raise here
+        for line in str(data, 'utf-8', 'replace').split('\n'):
+            key, sep, value = line.partition(':')
+            if sep:
+                message[key.strip()] = value.strip()
         return message
     
     def build_message(self, message_type: str, **kwargs) -> str:
@@ -48,31 +70,49 @@ class PokeProtocolBase(ABC):
         for key, value in kwargs.items():
             if value is not None:
                 if isinstance(value, dict):
-                    value = json.dumps(value)
+                    value = json_dumps(value)
                 lines.append(f"{key}: {value}")
         return '\n'.join(lines)
     
-    def send_message(self, message: str, address: Tuple[str, int]) -> bool:
-        """Send message to specific address"""
+    def build_ack(self, ack_number: Optional[str]) -> bytes:
+        """Build an encoded ACK message (same bytes as build_message("ACK", ...))"""
+        if ack_number is None:
+            return _ACK_BARE
+        return _ACK_PREFIX + str(ack_number).encode('utf-8')
+    
+    def send_bytes(self, payload: bytes, address: Tuple[str, int]) -> bool:
+        """Send an already-encoded message (fast path, no type checks)"""
         try:
-            self.socket.sendto(message.encode('utf-8'), address)
+            self.socket.sendto(payload, address)
             return True
-        except Exception as e:
+        except OSError as e:
             print(f"Failed to send message: {e}")
             return False
     
+    def send_message(self, message: Union[str, bytes], address: Tuple[str, int]) -> bool:
+        """Send message to specific address (pre-encoded bytes are sent as-is)"""
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        return self.send_bytes(message, address)
+    
+    def set_timeout(self, timeout: Optional[float]):
+        """Set the socket timeout, skipping the syscall if it is unchanged"""
+        if timeout != self._timeout:
+            self.socket.settimeout(timeout)
+            self._timeout = timeout
+    
     def receive_message(self, timeout: Optional[float] = None) -> Tuple[Optional[Dict[str, str]], Optional[Tuple[str, int]]]:
         """Receive and parse a message"""
         if timeout:
-            self.socket.settimeout(timeout)
+            self.set_timeout(timeout)
         
         try:
-            data, address = self.socket.recvfrom(1024)
-            message = self.parse_message(data)
+            nbytes, address = self.socket.recvfrom_into(self._rx_buf)
+            message = self.parse_message(self._rx_view[:nbytes])
             return message, address
         except socket.timeout:
             return None, None
-        except Exception as e:
+        except OSError as e:
             print(f"Error receiving message: {e}")
             return None, None
     
@@ -2,42 +2,144 @@
 battle_system.py - Handles Pokémon battle mechanics
 """
 
+import functools
 import random
-from typing import Dict, List, Tuple
+import sys
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 # Assuming pokemon_db is imported or defined in pokemon_data.py
 # If pokemon_db is defined in pokemon_data.py, you need an import like:
 # from pokemon_data import pokemon_db
 from pokemon_data import pokemon_db # Assuming this import is correct
+from pokemon_data import NO_TYPE, TYPE_CHART, TYPE_IDS, type_id
+
+# Move database (simplified); names are interned so lookups with the
+# module's own strings compare by identity
+MOVES = {sys.intern(name): move for name, move in {
+    'Tackle': {'type': 'normal', 'category': 'physical', 'power': 40, 'accuracy': 100},
+    'Ember': {'type': 'fire', 'category': 'special', 'power': 40, 'accuracy': 100},
+    'Water Gun': {'type': 'water', 'category': 'special', 'power': 40, 'accuracy': 100},
+    'Vine Whip': {'type': 'grass', 'category': 'physical', 'power': 45, 'accuracy': 100},
+    'Thunderbolt': {'type': 'electric', 'category': 'special', 'power': 90, 'accuracy': 100},
+    'Flamethrower': {'type': 'fire', 'category': 'special', 'power': 90, 'accuracy': 100},
+    'Hydro Pump': {'type': 'water', 'category': 'special', 'power': 110, 'accuracy': 80},
+    'Solar Beam': {'type': 'grass', 'category': 'special', 'power': 120, 'accuracy': 100},
+    'Earthquake': {'type': 'ground', 'category': 'physical', 'power': 100, 'accuracy': 100},
+    'Ice Beam': {'type': 'ice', 'category': 'special', 'power': 90, 'accuracy': 100},
+    'Psychic': {'type': 'psychic', 'category': 'special', 'power': 90, 'accuracy': 100},
+    'Shadow Ball': {'type': 'ghost', 'category': 'special', 'power': 80, 'accuracy': 100},
+}.items()}
+MOVE_NAMES = tuple(MOVES)
+MOVE_IDS = {name: i for i, name in enumerate(MOVE_NAMES)}
+MOVES_BY_ID = tuple(MOVES.values())
+
+# Struct-of-arrays view of MOVES indexed by move id, for vectorized callers
+MOVE_POWER = np.array([move['power'] for move in MOVES_BY_ID], dtype=np.int16)
+MOVE_ACCURACY = np.array([move['accuracy'] for move in MOVES_BY_ID], dtype=np.int8)
+MOVE_TYPE_IDS = np.array([type_id(move['type']) for move in MOVES_BY_ID], dtype=np.int8)
+MOVE_IS_SPECIAL = np.array([move['category'] != 'physical' for move in MOVES_BY_ID])
+
+# The same columns as plain Python rows; per-attack numpy scalar reads cost more than dict probes
+_MOVE_ROWS = tuple(zip(MOVE_POWER.tolist(), MOVE_ACCURACY.tolist(),
+                       MOVE_TYPE_IDS.tolist(), MOVE_IS_SPECIAL.tolist()))
+
+# Used for move names that are not in MOVES (same stats as Tackle)
+DEFAULT_MOVE_ID = MOVE_IDS['Tackle']
+
+# Dense (move type id, defender type id) -> multiplier matrix for vectorized callers;
+# every multiplier (0, .5, 1, 2) is exact in float32
+TYPE_CHART_ARRAY = np.array(TYPE_CHART, dtype=np.float32)
+
+# Simplified move assignment based on type
+TYPE_MOVES = {
+    'grass': ('Vine Whip', 'Solar Beam', 'Tackle'),
+    'fire': ('Ember', 'Flamethrower', 'Tackle'),
+    'water': ('Water Gun', 'Hydro Pump', 'Tackle'),
+    'electric': ('Thunderbolt', 'Tackle'),
+    'psychic': ('Psychic', 'Tackle'),
+    'ghost': ('Shadow Ball', 'Tackle'),
+    'ice': ('Ice Beam', 'Tackle'),
+    'ground': ('Earthquake', 'Tackle'),
+}
+
+
+def _build_moves_table() -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """Precompute the move list for every (type1, type2) pair; '' stands for any other/no type"""
+    table = {}
+    keys = list(TYPE_MOVES) + ['']
+    for type1 in keys:
+        for type2 in keys:
+            # Type1 moves first, then unseen type2 moves (dict keeps order, O(1) dedup)
+            moves = dict.fromkeys(TYPE_MOVES.get(type1, ()))
+            moves.update(dict.fromkeys(TYPE_MOVES.get(type2, ())))
+            moves = [sys.intern(move) for move in moves]
+            # Add some default moves if not enough
+            if len(moves) < 2:
+                moves.append('Tackle')
+            table[(type1, type2)] = tuple(moves[:4])  # Limit to 4 moves
+    return table
+
+
+_MOVES_BY_TYPES = _build_moves_table()
+
+
+def _moves_for_types(type1: Optional[str], type2: Optional[str]) -> Tuple[str, ...]:
+    type1 = type1.lower() if type1 else ''
+    type2 = type2.lower() if type2 else ''
+    if type1 not in TYPE_MOVES:
+        type1 = ''
+    if type2 not in TYPE_MOVES:
+        type2 = ''
+    return _MOVES_BY_TYPES[(type1, type2)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _available_moves(pokemon_name: str) -> Tuple[str, ...]:
+    """Move list per species; the Pokédex and move tables never change at runtime"""
+    # Only the types are read, so the shared record is enough
+    pokemon = pokemon_db.get_pokemon_by_name(pokemon_name, copy=False)
+    if not pokemon:
+        return MOVE_NAMES[:4]  # Default moves
+    return _moves_for_types(pokemon['type1'], pokemon.get('type2'))
+
+
+def _type_ids(pokemon: Dict) -> Tuple[int, int]:
+    return type_id(pokemon.get('type1')), type_id(pokemon.get('type2'))
+
+
+def _type_mask(type_ids: Tuple[int, int]) -> int:
+    """Bitset of a Pokémon's type ids (NO_TYPE never set) for one-op STAB checks"""
+    type1, type2 = type_ids
+    return ((1 << type1) | (1 << type2)) & ~(1 << NO_TYPE)
+
+
+def _damage_core(power: int, attacker_stat: int, defender_stat: int,
+                 type_effectiveness: float, stab: float, random_factor: float) -> int:
+    """Numeric part of the RFC damage formula, kept free of dict lookups"""
+    # Damage = (BasePower * AttackerStat * TypeEffectiveness * STAB) / DefenderStat * Random
+    base_damage = (power * attacker_stat * type_effectiveness * stab) / defender_stat
+    # Minimum damage is 1 if hit
+    return max(1, int(base_damage * random_factor))
 
 
 class BattleSystem:
     """Handles Pokémon battle calculations"""
     
     def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
         self.seed = seed or random.randint(1, 1000000)
-        random.seed(self.seed)
         
-        # Move database (simplified - you should 
-        self.moves = {
-            'Tackle': {'type': 'normal', 'category': 'physical', 'power': 40, 'accuracy': 100},
-            'Ember': {'type': 'fire', 'category': 'special', 'power': 40, 'accuracy': 100},
-            'Water Gun': {'type': 'water', 'category': 'special', 'power': 40, 'accuracy': 100},
-            'Vine Whip': {'type': 'grass', 'category': 'physical', 'power': 45, 'accuracy': 100},
-       
-            'Thunderbolt': {'type': 'electric', 'category': 'special', 'power': 90, 'accuracy': 100},
-            'Flamethrower': {'type': 'fire', 'category': 'special', 'power': 90, 'accuracy': 100},
-            'Hydro Pump': {'type': 'water', 'category': 'special', 'power': 110, 'accuracy': 80},
-            'Solar Beam': {'type': 'grass', 'category': 'special', 'power': 120, 'accuracy': 100},
-            'Earthquake': {'type': 'ground', 'category': 'physical', 'power': 100, 'accuracy': 100},
-     
-            'Ice Beam': {'type': 'ice', 'category': 'special', 'power': 90, 'accuracy': 100},
-            'Psychic': {'type': 'psychic', 'category': 'special', 'power': 90, 'accuracy': 100},
-            'Shadow Ball': {'type': 'ghost', 'category': 'special', 'power': 80, 'accuracy': 100},
-        }
+        # Both peers share the seed and draw from the same Mersenne Twister stream as
+        # random.seed(seed) (accuracy roll, then a random factor only on a hit), so they
+        # stay in lockstep with each other and with peers using the global random module
+        self._rng = random.Random(self.seed)
+        # Separate, pinned stream for batch draws so they never shift the live roll sequence
+        self._batch_rng = np.random.Generator(np.random.PCG64((self.seed, 1)))
+        
+        # Move database (shared, read-only)
+        self.moves = MOVES
     
-    def calculate_damage(self, attacker: Dict, defender: Dict, move_name: str, 
+    def calculate_damage(self, attacker: Dict, defender: Dict, move_name: Union[str, int], 
                    
                         special_attack_boost: bool = False, 
                         special_defense_boost: bool = False) -> Dict:
@@ -45,24 +147,17 @@ class BattleSystem:
         Calculate damage according to PokeProtocol formula:
         Damage = (BasePower × AttackerStat × TypeEffectiveness) / DefenderStat
         """
-        if move_name not in self.moves:
-     
-            # Default move if not found
-            move = {'type': 'normal', 'category': 'physical', 'power': 40, 'accuracy': 100}
+        if isinstance(move_name, int):
+            # Move id (index into MOVE_NAMES)
+            move_id = move_name
+            move_name = MOVE_NAMES[move_id]
         else:
-            move = self.moves[move_name]
-        
-        # Check accuracy
-        if random.randint(1, 100) > move['accuracy']:
-            return {
-  
-                'damage': 0,
-                'hit': False,
-                'message': f"{attacker['name']} used {move_name}... but it missed!"
-            }
+            # Default move if not found
+            move_id = MOVE_IDS.get(move_name, DEFAULT_MOVE_ID)
+        is_special = _MOVE_ROWS[move_id][3]
         
         # Get attacker and defender stats based on move category
-        if move['category'] == 'physical':
+        if not is_special:
             attacker_stat = attacker['attack']
             defender_stat = defender['defense']
         else:  # special move
@@ -75,48 +170,26 @@ class BattleSystem:
                 attacker_stat = int(attacker_stat * 1.5)
             if special_defense_boost:
                 defender_stat = int(defender_stat * 1.5)
-  
-       
-        # Calculate type effectiveness (Type1Effectiveness * Type2Effectiveness)
-        
-        # 1. Get effectiveness against Type 1
-        type1_effectiveness = pokemon_db.get_type_effectiveness(
-            move['type'], 
-            [defender['type1']] # Pass only Type 1
-        )
         
-        type2_effectiveness = 1.0
-        if defender.get('type2'):
-            # 2. Get effectiveness against Type 2 (if it exists)
-            type2_effectiveness = pokemon_db.get_type_effectiveness(
-                move['type'], 
-                [defender['type2']] # Pass only Type 2
-            )
-        
-        # 3. Multiply them to get the final multiplier (as per RFC)
-        type_effectiveness = type1_effectiveness * type2_effectiveness
- 
-        
-        # Apply STAB (Same Type Attack Bonus) - 1.5x if move type matches attacker's type
-        stab = 1.0
-        if (move['type'].lower() == attacker['type1'].lower() or 
-            (attacker['type2'] and move['type'].lower() == attacker['type2'].lower())):
-            stab = 1.5
-        
-        # Random factor (0.85 to 1.0)
-        random_factor = random.uniform(0.85, 1.0)
-        
-        # Calculate damage using the formula from RFC
         if defender_stat == 0:
             defender_stat = 1  # Prevent division by zero
         
-        # Damage = (BasePower * AttackerStat * TypeEffectiveness * STAB) / DefenderStat * Random
-        base_damage = (move['power'] * attacker_stat * type_effectiveness * stab) / defender_stat
-      
-        damage = int(base_damage * random_factor)
+        type_mask = attacker.get('type_mask')
+        if type_mask is None:
+            type_mask = _type_mask(attacker.get('type_ids') or _type_ids(attacker))
         
-        # Minimum damage is 1 if hit
-        damage = max(1, damage)
+        damage, type_effectiveness, stab_applied = self._calculate_damage_fast(
+            move_id, attacker_stat, defender_stat, type_mask,
+            defender.get('type_ids') or _type_ids(defender))
+        
+        # Hits deal at least 1 damage, so 0 means the move missed
+        if not damage:
+            return {
+  
+                'damage': 0,
+                'hit': False,
+                'message': f"{attacker['name']} used {move_name}... but it missed!"
+            }
         
         # Generate message
         effectiveness_text = ""
@@ -127,13 +200,14 @@ class BattleSystem:
         elif type_effectiveness == 0:
             effectiveness_text = " It had no effect!"
         message = f"{attacker['name']} used {move_name}!{effectiveness_text}"
+        move = MOVES_BY_ID[move_id]
         
         return {
             'damage': damage,
             'hit': True,
             'message': message,
             'type_effectiveness': type_effectiveness,
-            'stab_applied': stab > 1.0,
+            'stab_applied': stab_applied,
             
             'move_type': move['type'],
             'move_category': move['category'],
@@ -141,44 +215,58 @@ class BattleSystem:
             'defender_stat_used': defender_stat
         }
     
+    def _calculate_damage_fast(self, move_id: int, attacker_stat: int, defender_stat: int,
+                               attacker_type_mask: int, defender_type_ids: Tuple[int, int]) -> Tuple[int, float, bool]:
+        """(damage, type effectiveness, STAB applied) without building a report; damage is 0 on a miss.
+        
+        Stats are the final ones (category picked, boosts applied, non-zero defense).
+        Draws from the shared roll stream exactly like calculate_damage.
+        """
+        power, accuracy, move_type, _ = _MOVE_ROWS[move_id]
+        # Calculate type effectiveness (Type1Effectiveness * Type2Effectiveness)
+        effectiveness_row = TYPE_CHART[move_type]
+        type_effectiveness = effectiveness_row[defender_type_ids[0]] * effectiveness_row[defender_type_ids[1]]
+        # Check accuracy
+        rng = self._rng
+        if rng.randint(1, 100) > accuracy:
+            return 0, type_effectiveness, False
+        # Apply STAB (Same Type Attack Bonus) - 1.5x if move type matches attacker's type
+        stab_applied = ((attacker_type_mask >> move_type) & 1) == 1
+        stab = 1.5 if stab_applied else 1.0
+        # Random factor (0.85 to 1.0), drawn only on a hit
+        random_factor = rng.uniform(0.85, 1.0)
+        # Calculate damage using the formula from RFC
+        return _damage_core(power, attacker_stat, defender_stat,
+                            type_effectiveness, stab, random_factor), type_effectiveness, stab_applied
+    
+    def calculate_damage_batch(self, power: np.ndarray, attacker_stat: np.ndarray,
+                               defender_stat: np.ndarray, type_effectiveness: np.ndarray,
+                               stab: np.ndarray, random_factor: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vectorized _damage_core over matching arrays (hits only; no accuracy or messages)"""
+        if random_factor is None:
+            random_factor = self._batch_rng.uniform(0.85, 1.0, size=len(power))
+        # Prevent division by zero
+        defender_stat = np.where(defender_stat == 0, 1, defender_stat)
+        # float64 keeps small-int inputs (e.g. int16 stats) from overflowing and matches the scalar path
+        base_damage = np.multiply(power, attacker_stat, dtype=np.float64)
+        base_damage *= type_effectiveness
+        base_damage *= stab
+        base_damage /= defender_stat
+        base_damage *= random_factor
+        # Minimum damage is 1 if hit
+        return np.maximum(base_damage.astype(np.int32), 1)
+    
+    @staticmethod
+    def type_effectiveness_batch(move_type_ids: np.ndarray, defender_type1_ids: np.ndarray,
+                                 defender_type2_ids: np.ndarray) -> np.ndarray:
+        """Type effectiveness for many attacks at once (NO_TYPE ids are neutral)"""
+        return (TYPE_CHART_ARRAY[move_type_ids, defender_type1_ids]
+                * TYPE_CHART_ARRAY[move_type_ids, defender_type2_ids])
+    
     def get_available_moves(self, pokemon_name: str) -> List[str]:
         """Get moves that a Pokémon can learn (simplified)"""
-        pokemon = pokemon_db.get_pokemon_by_name(pokemon_name)
-        if not pokemon:
-    
-            return list(self.moves.keys())[:4]  # Default moves
-        
-        # Simplified move assignment based on type
-        type_moves = {
-            'grass': ['Vine Whip', 'Solar Beam', 'Tackle'],
-            'fire': ['Ember', 'Flamethrower', 'Tackle'],
-            'water': ['Water Gun', 'Hydro Pump', 'Tackle'],
-      
-            'electric': ['Thunderbolt', 'Tackle'],
-            'psychic': ['Psychic', 'Tackle'],
-            'ghost': ['Shadow Ball', 'Tackle'],
-            'ice': ['Ice Beam', 'Tackle'],
-            'ground': ['Earthquake', 'Tackle']
-        }
-        
-        moves = []
-        
-        # Add moves for type1
-        if pokemon['type1'].lower() in type_moves:
-            moves.extend(type_moves[pokemon['type1'].lower()])
-        
-        # Add moves for type2 if exists
-        if pokemon.get('type2') and pokemon['type2'].lower() in type_moves:
-            for move in type_moves[pokemon['type2'].lower()]:
-                if move not in moves:
-   
-                    moves.append(move)
-        
-        # Add some default moves if not enough
-        if len(moves) < 2:
-            moves.append('Tackle')
-        
-        return moves[:4]  # Limit to 4 moves
+        # Fresh list: callers keep it on the battle Pokémon
+        return list(_available_moves(pokemon_name))
     
     def create_battle_pokemon(self, pokemon_data: Dict, stat_boosts: Dict) -> Dict:
         """Create a battle-ready Pokémon with stat boosts"""
@@ -188,6 +276,13 @@ class BattleSystem:
         battle_pokemon['stat_boosts'] = stat_boosts.copy()
         battle_pokemon['status'] = None  # Can be 'poisoned', 'paralyzed', etc.
         battle_pokemon['available_moves'] = self.get_available_moves(pokemon_data['name'])
+        # Canonicalize types once so nothing per-attack has to lower() them
+        type1 = (pokemon_data.get('type1') or '').lower()
+        type2 = (pokemon_data.get('type2') or '').lower() or None
+        battle_pokemon['type1'] = type1
+        battle_pokemon['type2'] = type2
+        battle_pokemon['type_ids'] = (TYPE_IDS.get(type1, NO_TYPE), TYPE_IDS.get(type2, NO_TYPE))
+        battle_pokemon['type_mask'] = _type_mask(battle_pokemon['type_ids'])
         return battle_pokemon
     
     def apply_damage(self, pokemon: Dict, damage: int) -> Dict:
@@ -196,6 +291,13 @@ class BattleSystem:
         pokemon['fainted'] = pokemon['current_hp'] == 0
         return pokemon
     
+    @staticmethod
+    def apply_damage_batch(hp: np.ndarray, damage: np.ndarray) -> np.ndarray:
+        """Apply damage to many Pokémon in place (e.g. int16 HP arrays); returns the fainted mask"""
+        np.subtract(hp, damage, out=hp)
+        np.maximum(hp, 0, out=hp)
+        return hp == 0
+    
     def get_battle_summary(self, attacker: Dict, defender: Dict, 
                           damage_result: Dict) -> Dict:
  
@@ -211,7 +313,3 @@ class BattleSystem:
             'type_effectiveness': damage_result.get('type_effectiveness', 1.0),
             'move_category': damage_result.get('move_category', 'physical')
         }
-
-
-# Global instance for easy access
-battle_system = BattleSystem()
\ No newline at end of file
@@ -1,8 +1,131 @@
+import ctypes
+import errno
+import os
 import socket
+import stat
+import sys
 import threading
-from typing import Tuple, Dict, Set
+import time
+from typing import List, Optional, Tuple, Dict, Set
 
 BUFFER = 2048
+SENDMMSG_MIN_PEERS = 8  # below this a plain sendto() loop is faster than the ctypes call
+
+
+# -------------------------------------------------------------
+# sendmmsg(2) bindings (Linux only, stdlib has no wrapper)
+# -------------------------------------------------------------
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_uint8 * 4),
+        ("sin_zero", ctypes.c_uint8 * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+_sendmmsg = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _sendmmsg = _libc.sendmmsg
+        _sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+        _sendmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _sendmmsg = None
+
+
+class _Fanout:
+    """
+    Sends one packet to a fixed list of peers with a single sendmmsg() call.
+    Addresses are resolved and the headers built once per peer list; every
+    header shares one iovec over a reusable buffer, so a send only copies
+    the packet in. Small peer lists, Unix socket peers and platforms
+    without sendmmsg use one sendto() per peer instead.
+    """
+
+    def __init__(self, sock: socket.socket, peers: List[Tuple[str, int]]):
+        self.sock = sock
+        self.peers = peers
+        self.count = len(peers)
+        self.enabled = (_sendmmsg is not None and sock.family == socket.AF_INET
+                        and self.count >= SENDMMSG_MIN_PEERS)
+        if not self.enabled:
+            return
+
+        self.buffer = ctypes.create_string_buffer(BUFFER)
+        self.iov = _IOVec(ctypes.addressof(self.buffer), 0)
+        self.addrs = (_SockAddrIn * self.count)()
+        self.msgs = (_MMsgHdr * self.count)()
+        self.msgs_base = ctypes.addressof(self.msgs)
+        iov_ptr = ctypes.pointer(self.iov)
+
+        for i, (ip, port) in enumerate(peers):
+            self.addrs[i].sin_family = socket.AF_INET
+            self.addrs[i].sin_port = socket.htons(port)
+            self.addrs[i].sin_addr[:] = socket.inet_aton(socket.gethostbyname(ip))
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self.addrs[i])
+            hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+            hdr.msg_iov = iov_ptr
+            hdr.msg_iovlen = 1
+
+    def send(self, packet: bytes) -> List[Tuple[Tuple[str, int], OSError]]:
+        """Send to every peer; one failing peer doesn't stop the rest. Returns the failures."""
+        failures = []
+        if not self.enabled:
+            for peer in self.peers:
+                try:
+                    self.sock.sendto(packet, peer)
+                except OSError as e:
+                    failures.append((peer, e))
+            return failures
+
+        size = len(packet)
+        if size > len(self.buffer):
+            self.buffer = ctypes.create_string_buffer(size)
+            self.iov.iov_base = ctypes.addressof(self.buffer)
+        ctypes.memmove(self.buffer, packet, size)
+        self.iov.iov_len = size
+
+        # sendmmsg stops at the first failing header; record it and resume after it
+        fd = self.sock.fileno()
+        sent = 0
+        while sent < self.count:
+            n = _sendmmsg(fd, self.msgs_base + sent * ctypes.sizeof(_MMsgHdr), self.count - sent, 0)
+            if n < 0:
+                err = ctypes.get_errno()
+                failures.append((self.peers[sent], OSError(err, os.strerror(err))))
+                n = 1
+            sent += n
+        return failures
+
+
+# Chat payload type -> broadcast line, looked up once per packet
+_CHAT_FORMATTERS = {
+    "CHAT": lambda payload: f"{payload.get('sender')}: {payload.get('text')}",
+    "STICKER": lambda payload: f"{payload.get('sender')} sent sticker [{payload.get('id')}]",
+}
 
 
 class ChatManager:
@@ -12,22 +135,49 @@ class ChatManager:
 
     Joiners/Spectators connect using a simple UDP socket and send messages to HOST.
     Host then broadcasts to all connected peers.
+
+    For single-machine setups pass `unix_path` to use a Unix datagram socket
+    instead, which skips the IP/UDP stack; peers then bind and dial paths.
     """
 
-    def __init__(self, host_ip: str, host_port: int = 9999):
+    def __init__(self, host_ip: str, host_port: int = 9999, unix_path: Optional[str] = None):
         self.host_ip = host_ip
         self.host_port = host_port
+        self.unix_path = unix_path
 
-        # UDP socket for chat communication
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.bind((host_ip, host_port))
+        if unix_path:
+            # Local IPC chat socket
+            try:
+                mode = os.lstat(unix_path).st_mode
+            except FileNotFoundError:
+                pass
+            else:
+                # Only clear a stale socket from an earlier run, never some other file
+                if not stat.S_ISSOCK(mode):
+                    raise FileExistsError(errno.EEXIST, "Chat path exists and is not a socket", unix_path)
+                os.unlink(unix_path)
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self.socket.bind(unix_path)
+        else:
+            # UDP socket for chat communication
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.socket.bind((host_ip, host_port))
+        # One receive buffer reused for every datagram
+        self._rx_buf = bytearray(BUFFER)
+        self._rx_view = memoryview(self._rx_buf)
 
         # Track connected users
         self.players: Set[Tuple[str, int]] = set()
         self.spectators: Set[Tuple[str, int]] = set()
+        self._fanout: Optional[_Fanout] = None  # cached sender for players | spectators
+        # Registration packet -> (member set, role label)
+        self._registrations = {
+            b"REGISTER_PLAYER": (self.players, "Player"),
+            b"REGISTER_SPECTATOR": (self.spectators, "Spectator"),
+        }
 
         self.running = False
-        print(f"[CHAT SERVER] Bound to {host_ip}:{host_port}")
+        print(f"[CHAT SERVER] Bound to {unix_path or f'{host_ip}:{host_port}'}")
 
     # -------------------------------------------------------------
     # PUBLIC: Start chat server
@@ -44,55 +194,63 @@ class ChatManager:
     def _receive_loop(self):
         while self.running:
             try:
-                data, addr = self.socket.recvfrom(BUFFER)
-                message = data.decode()
-
-                msg_type, payload = self._parse_message(message)
-
-                # Register new client type
-                if msg_type == "REGISTER_PLAYER":
-                    self.players.add(addr)
-                    print(f"[CHAT] Player joined: {addr}")
-                    self._broadcast_system(f"Player {addr} joined the chat.")
-                    continue
-
-                elif msg_type == "REGISTER_SPECTATOR":
-                    self.spectators.add(addr)
-                    print(f"[CHAT] Spectator joined: {addr}")
-                    self._broadcast_system(f"Spectator {addr} joined the chat.")
-                    continue
-
-                # Normal chat message
-                elif msg_type == "CHAT":
-                    formatted = f"{payload.get('sender')}: {payload.get('text')}"
-                    print(f"[CHAT] {formatted}")
-                    self._broadcast_raw(formatted)
-                    continue
-
-                # Sticker
-                elif msg_type == "STICKER":
-                    formatted = f"{payload.get('sender')} sent sticker [{payload.get('id')}]"
-                    print(f"[CHAT] {formatted}")
-                    self._broadcast_raw(formatted)
-                    continue
+                nbytes, addr = self.socket.recvfrom_into(self._rx_buf)
+            except OSError as e:
+                # Closed socket (stop() or teardown): leave instead of spinning
+                if not self.running or e.errno == errno.EBADF:
+                    break
+                print("[CHAT ERROR]", e)
+                time.sleep(0.01)
+                continue
 
+            try:
+                self._handle_packet(bytes(self._rx_view[:nbytes]), addr)
             except Exception as e:
                 print("[CHAT ERROR]", e)
 
+    def _handle_packet(self, data: bytes, addr: Tuple[str, int]):
+        # Registration packets are fixed strings, so match them on the raw bytes
+        raw = data.strip()
+
+        # Register new client type
+        registration = self._registrations.get(raw)
+        if registration is not None:
+            members, role = registration
+            members.add(addr)
+            self._fanout = None
+            print(f"[CHAT] {role} joined: {addr}")
+            self._broadcast_system(f"{role} {addr} joined the chat.")
+            return
+
+        # Only chat/sticker payloads need decoding (once)
+        msg_type, payload = self._parse_message(raw.decode(errors="replace"))
+
+        # Normal chat message or sticker; anything else is ignored
+        formatter = _CHAT_FORMATTERS.get(msg_type)
+        if formatter is not None:
+            formatted = formatter(payload)
+            print(f"[CHAT] {formatted}")
+            self._broadcast_raw(formatted)
+
     # -------------------------------------------------------------
     # SEND MESSAGES
     # -------------------------------------------------------------
     def _broadcast_raw(self, text: str):
         """Broadcast raw text string to all clients."""
-        packet = text.encode()
-        for p in self.players | self.spectators:
-            self.socket.sendto(packet, p)
+        self._broadcast_packet(text.encode())
 
     def _broadcast_system(self, text: str):
         """Send a system-style message."""
-        packet = f"SYSTEM: {text}".encode()
-        for p in self.players | self.spectators:
-            self.socket.sendto(packet, p)
+        self._broadcast_packet(f"SYSTEM: {text}".encode())
+
+    def _broadcast_packet(self, packet: bytes):
+        """Fan one encoded packet out to every player and spectator."""
+        fanout = self._fanout
+        if fanout is None:
+            # Rebuilt only after a join, not on every broadcast
+            fanout = self._fanout = _Fanout(self.socket, list(self.players | self.spectators))
+        for peer, error in fanout.send(packet):
+            print(f"[CHAT ERROR] {peer}: {error}")
 
     # -------------------------------------------------------------
     # HELPERS
@@ -126,7 +284,7 @@ class ChatManager:
                     payload[k] = v
 
             return msg_type, payload
-        except:
+        except (IndexError, ValueError):
             return "UNKNOWN", {}
 
     # -------------------------------------------------------------
@@ -135,4 +293,6 @@ class ChatManager:
     def stop(self):
         self.running = False
         self.socket.close()
+        if self.unix_path and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
         print("[CHAT SERVER] Stopped.")
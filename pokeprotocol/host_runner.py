@@ -8,22 +8,30 @@ import socket
 import random
 import json
 import sys
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Set
 from base_protocol import PokeProtocolBase
 from pokemon_utils import normalize_pokemon_record
 from pokemon_data import pokemon_db
 from chatManager import ChatManager
-from battle_system import BattleSystem, battle_system
+from battle_system import BattleSystem
 
 CHAT_PORT = 9999
 
+# Only the seed varies between handshake responses
+_HANDSHAKE_RESPONSE_PREFIX = b"message_type: HANDSHAKE_RESPONSE\nseed: "
+
 class PokeProtocolHost(PokeProtocolBase):
     """Host implementation of PokeProtocol"""
     
-    def __init__(self, port: int = 5000):
-        super().__init__(port)
+    __slots__ = ('seed', 'spectators', 'battle_state', 'pokedex', 'host_pokemon',
+                 'joiner_pokemon', 'battle_engine', 'is_host_turn', 'opponent_calc_report',
+                 'local_ip', 'chat')
+    
+    def __init__(self, port: int = 5000, rcvbuf_size: Optional[int] = None,
+                 sndbuf_size: Optional[int] = None):
+        super().__init__(port, rcvbuf_size, sndbuf_size)
         self.seed: Optional[int] = None
-        self.spectators = []
+        self.spectators: Set[Tuple[str, int]] = set()
         self.battle_state = "WAITING_FOR_CONNECTION"
         self.pokedex = pokemon_db
         self.host_pokemon: Optional[Dict[str, Any]] = None 
@@ -69,7 +77,7 @@ class PokeProtocolHost(PokeProtocolBase):
                 s.connect(("8.8.8.8", 80))
                 local_ip = s.getsockname()[0]
                 s.close()
-            except:
+            except OSError:
                 local_ip = "127.0.0.1"
             self.local_ip = local_ip
             print(f"✓ Host listening on:")
@@ -79,7 +87,7 @@ class PokeProtocolHost(PokeProtocolBase):
             print("="*60)
             return True
             
-        except Exception as e:
+        except OSError as e:
             print(f"✗ Failed to bind to port {self.port}: {e}")
             return False
     
@@ -475,8 +483,10 @@ class PokeProtocolHost(PokeProtocolBase):
         max_retries = 3
         timeout = 5
         
+        # Encode once; retries resend the same bytes
+        payload = message.encode('utf-8')
         for attempt in range(max_retries):
-            if self.send_message(message, self.peer_address):
+            if self.send_bytes(payload, self.peer_address):
                 print(f"\n🎉 Sent GAME_OVER! {winner} wins. (Attempt {attempt + 1}/{max_retries})")
                 
                 # Wait for ACK
@@ -496,8 +506,8 @@ class PokeProtocolHost(PokeProtocolBase):
 
     def send_ack(self, ack_number: str):
         """Send a basic ACK message"""
-        ack_message = self.build_message(message_type="ACK", ack_number=ack_number)
-        self.send_message(ack_message, self.peer_address)
+        ack_message = self.build_ack(ack_number)
+        self.send_bytes(ack_message, self.peer_address)
 
     def show_help(self):
         """Show help information"""
@@ -517,7 +527,7 @@ class PokeProtocolHost(PokeProtocolBase):
         print("\n⏳ Waiting for player connection... (Press Enter to cancel)")
         
         # Set socket to non-blocking for cancel checking
-        self.socket.settimeout(1.0)
+        self.set_timeout(1.0)
         
         try:
             while True:
@@ -538,19 +548,16 @@ class PokeProtocolHost(PokeProtocolBase):
         except KeyboardInterrupt:
             print("\nCancelled waiting for player")
         finally:
-            self.socket.settimeout(None)
+            self.set_timeout(None)
     
     def send_handshake_response(self) -> bool:
         """Send HANDSHAKE_RESPONSE with random seed"""
         self.seed = random.randint(1, 1000000)
         self.battle_engine = BattleSystem(self.seed)
         
-        message = self.build_message(
-            message_type="HANDSHAKE_RESPONSE",
-            seed=self.seed
-        )
+        message = _HANDSHAKE_RESPONSE_PREFIX + str(self.seed).encode('utf-8')
         
-        if self.send_message(message, self.peer_address):
+        if self.send_bytes(message, self.peer_address):
             self.connected = True
             print(f"✓ Sent HANDSHAKE_RESPONSE with seed: {self.seed}")
             return True
@@ -562,7 +569,7 @@ class PokeProtocolHost(PokeProtocolBase):
         """Accept SPECTATOR_REQUEST"""
         print("\n⏳ Waiting for spectator... (Press Enter to cancel)")
         
-        self.socket.settimeout(1.0)
+        self.set_timeout(1.0)
         
         try:
             while True:
@@ -572,7 +579,7 @@ class PokeProtocolHost(PokeProtocolBase):
                     if message and message.get('message_type') == 'SPECTATOR_REQUEST':
                         print(f"\n✓ Received spectator request from {address[0]}:{address[1]}")
                         if address not in self.spectators:
-                            self.spectators.append(address)
+                            self.spectators.add(address)
                             self.send_spectator_response(address)
                         return
                     
@@ -581,7 +588,7 @@ class PokeProtocolHost(PokeProtocolBase):
         except KeyboardInterrupt:
             print("\nCancelled waiting for spectator")
         finally:
-            self.socket.settimeout(None)
+            self.set_timeout(None)
     
     def send_spectator_response(self, address: Tuple[str, int]):
         """Send response to spectator"""
@@ -597,8 +604,12 @@ class PokeProtocolHost(PokeProtocolBase):
             print("✗ Failed to send spectator response") 
     
     def broadcast_to_spectators(self, message):
-        for spec in self.spectators:
-            self.send_message(message, spec)
+        # Encode once, not once per spectator
+        payload = message.encode('utf-8')
+        # Iterate a snapshot and drop unreachable spectators afterwards
+        send = self.send_bytes
+        dead = [spec for spec in list(self.spectators) if not send(payload, spec)]
+        self.spectators.difference_update(dead)
 
     
     def start_battle_setup(self):
@@ -706,7 +717,7 @@ class PokeProtocolHost(PokeProtocolBase):
                 # ----------------------------
 
                 self.joiner_pokemon = self.battle_engine.create_battle_pokemon(raw_pokemon, raw_boosts)
-            except Exception as e:
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
                 print(f"✗ Error parsing opponent's Pokémon data: {e}")
                 return
             
@@ -715,7 +726,7 @@ class PokeProtocolHost(PokeProtocolBase):
             try:
                 boosts = json.loads(boosts_json)
                 print(f"Stat boosts: {boosts}")
-            except:
+            except ValueError:
                 print(f"Stat boosts: {boosts_json}")
             
             # --- FIX: Set state and return *after* successful parsing ---
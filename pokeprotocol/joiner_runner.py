@@ -5,6 +5,7 @@ Usage: python joiner_runner.py [host_ip] [port]
 """
 
 import socket
+import errno
 import json
 import sys
 import time
@@ -15,15 +16,20 @@ from pokemon_utils import normalize_pokemon_record
 from pokemon_data import pokemon_db
 import socket
 CHAT_PORT = 9999
-from battle_system import BattleSystem, battle_system
+from battle_system import BattleSystem
 from chatManager import ChatManager
 
 
 class PokeProtocolJoiner(PokeProtocolBase):
     """Joiner implementation of PokeProtocol"""
     
-    def __init__(self, host_ip: str, host_port: int = 5000):
-        super().__init__(host_port)
+    __slots__ = ('host_address', 'seed', 'battle_state', 'pokedex', 'host_pokemon',
+                 'joiner_pokemon', 'battle_engine', 'is_host_turn', 'local_turn_report',
+                 'chat_socket', 'chat_running')
+    
+    def __init__(self, host_ip: str, host_port: int = 5000, rcvbuf_size: Optional[int] = None,
+                 sndbuf_size: Optional[int] = None):
+        super().__init__(host_port, rcvbuf_size, sndbuf_size)
         self.host_address = (host_ip, host_port)
         self.seed: Optional[int] = None
         self.battle_state = "DISCONNECTED"
@@ -39,13 +45,21 @@ class PokeProtocolJoiner(PokeProtocolBase):
 
 
     def start_chat_listener(self):
+        buf = bytearray(4096)
+        view = memoryview(buf)
+
         def listen():
             while self.chat_running:
                 try:
-                    data, addr = self.chat_socket.recvfrom(4096)
-                    print(f"\n💬 {data.decode()}")
-                except:
-                    pass
+                    nbytes, addr = self.chat_socket.recvfrom_into(buf)
+                    print(f"\n💬 {str(view[:nbytes], 'utf-8', 'replace')}")
+                except socket.timeout:
+                    continue
+                except OSError as e:
+                    # A closed socket would fail forever; anything else gets a short back-off
+                    if e.errno == errno.EBADF:
+                        break
+                    time.sleep(0.01)
 
         self.chat_running = True
         thread = threading.Thread(target=listen, daemon=True)
@@ -117,7 +131,7 @@ class PokeProtocolJoiner(PokeProtocolBase):
         try:
             self.chat_socket.sendto(msg.encode(), (self.host_address[0], CHAT_PORT))
             print("✓ Message sent!")
-        except Exception as e:
+        except OSError as e:
             print(f"✗ Chat send error: {e}")
 
 
@@ -155,17 +169,25 @@ class PokeProtocolJoiner(PokeProtocolBase):
         """Send HANDSHAKE_REQUEST to host """
         print(f"\n🔗 Connecting to host...")
         
-        message = self.build_message(message_type="HANDSHAKE_REQUEST")
+        # Encoded once and resent as-is on every retry
+        message = self.build_message(message_type="HANDSHAKE_REQUEST").encode('utf-8')
         
-        for attempt in range(max_retries):
-            print(f"Attempt {attempt + 1}/{max_retries}...")
+        # Early attempts wait briefly and back off; retries continue until the same
+        # worst-case window as max_retries fixed 3 s waits with 1 s pauses is used up
+        deadline = time.monotonic() + max_retries * 3.0 + (max_retries - 1) * 1.0
+        attempt = 0
+        while True:
+            attempt += 1
+            print(f"Attempt {attempt}...")
             
-            if self.send_message(message, self.host_address):
+            if self.send_bytes(message, self.host_address):
                 print("✓ Handshake request sent")
                 
                 # Wait for response 
                 print("⏳ Waiting for host response...")
-                response, address = self.receive_message(timeout=3)
+                # Exponential back-off: 0.25 s, 0.5 s, 1 s, 2 s, then capped at 3 s
+                wait = min(3.0, 0.25 * (2 ** (attempt - 1)), deadline - time.monotonic())
+                response, address = self.receive_message(timeout=max(0.01, wait))
                 
                 if response and response.get('message_type') == 'HANDSHAKE_RESPONSE':
                     self.handle_handshake_response(response, address)
@@ -175,10 +197,12 @@ class PokeProtocolJoiner(PokeProtocolBase):
             else:
                 print("Failed to send request, retrying...")
             
-            if attempt < max_retries - 1:
-                time.sleep(1)  # Wait before retry
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(1.0, 0.1 * (2 ** (attempt - 1)), remaining))  # Wait before retry, backing off
         
-        print(f"\n✗ Failed to connect after {max_retries} attempts")
+        print(f"\n✗ Failed to connect after {attempt} attempts")
         return False
     
     def handle_handshake_response(self, response: dict, address: Tuple[str, int]):
@@ -300,7 +324,7 @@ class PokeProtocolJoiner(PokeProtocolBase):
                 raw_pokemon = json.loads(pokemon_json)
                 raw_boosts = json.loads(boosts_json)
                 self.host_pokemon = self.battle_engine.create_battle_pokemon(raw_pokemon, raw_boosts)
-            except:
+            except (ValueError, KeyError, TypeError, AttributeError):
                 print("✗ Error parsing host's Pokémon data.")
                 return
             
@@ -310,7 +334,7 @@ class PokeProtocolJoiner(PokeProtocolBase):
                 boosts = json.loads(boosts_json)
                 print(f"Stat boosts: {boosts}")
 
-            except:
+            except ValueError:
                 print(f"Stat boosts: {boosts_json}")
             
             self.battle_state = "WAITING_FOR_MOVE" 
@@ -329,7 +353,7 @@ class PokeProtocolJoiner(PokeProtocolBase):
         print("\n⏳ Entering battle loop. Waiting for Host's first move...")
         
         # FIX: Set timeout for non-blocking read to allow periodic turn check
-        self.socket.settimeout(0.5) 
+        self.set_timeout(0.5) 
         
         while self.battle_state not in ["ERROR", "GAME_OVER", "DISCONNECTED"]:
             try:
@@ -390,7 +414,7 @@ class PokeProtocolJoiner(PokeProtocolBase):
                 break
         
         # Reset timeout behavior after loop ends
-        self.socket.settimeout(None)
+        self.set_timeout(None)
 
     def calculate_opponent_attack(self, move_name: str, attacker: Dict, defender: Dict) -> Dict:
         """Helper to calculate and apply damage for the reactive peer (Joiner defending)."""
@@ -608,8 +632,10 @@ class PokeProtocolJoiner(PokeProtocolBase):
         max_retries = 3
         timeout = 5
         
+        # Encode once; retries resend the same bytes
+        payload = message.encode('utf-8')
         for attempt in range(max_retries):
-            if self.send_message(message, self.peer_address):
+            if self.send_bytes(payload, self.peer_address):
                 print(f"\n🎉 Sent GAME_OVER! {winner} wins. (Attempt {attempt + 1}/{max_retries})")
                 
                 # Wait for ACK
@@ -629,8 +655,8 @@ class PokeProtocolJoiner(PokeProtocolBase):
 
     def send_ack(self, ack_number: str):
         """Send a basic ACK message"""
-        ack_message = self.build_message(message_type="ACK", ack_number=ack_number) 
-        self.send_message(ack_message, self.peer_address)
+        ack_message = self.build_ack(ack_number)
+        self.send_bytes(ack_message, self.peer_address)
 
 
     def fetch_pokemon(self, pokemon_name: str):
@@ -1,14 +1,45 @@
 """
 json_utils.py - Helpers to ensure data structures are JSON serializable.
 """
+import json
+from functools import partial
 from typing import Any
 
+# Exact types json encodes as-is (type() match, no isinstance MRO walk)
+_PLAIN_TYPES = frozenset((int, float, str, bool, type(None)))
+
+
+def _default(value: Any) -> Any:
+    """
+    json.dumps hook, only called for objects json can't encode natively
+    (numpy/pandas scalars and arrays, sets, anything unexpected).
+    """
+    if hasattr(value, "tolist"):
+        # numpy scalar (-> int/float/bool) or array (-> nested lists)
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # Fallback to string representation for anything unexpected
+    return str(value)
+
+
+# Serialize in a single pass; plain dict/list/str/int/float/None never reach _default
+dumps = partial(json.dumps, default=_default)
+
 
 def sanitize_for_json(value: Any) -> Any:
     """
     Convert common pandas/numpy objects into plain Python types so json.dumps
     can handle them.
     """
+    # Fast path: flat dicts of plain values (most protocol messages) need no recursion
+    if type(value) is dict and all(
+        type(key) is str and type(val) in _PLAIN_TYPES for key, val in value.items()
+    ):
+        return value.copy()
+
     # numpy scalar or pandas Series value
     if hasattr(value, "item"):
         try:
@@ -27,4 +58,3 @@ def sanitize_for_json(value: Any) -> Any:
 
     # Fallback to string representation for anything unexpected
     return str(value)
-
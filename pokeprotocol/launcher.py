@@ -6,8 +6,6 @@ Run this file to get a menu to choose which to run.
 import os
 import sys
 import subprocess
-import load_pokemon
-from load_pokemon import Pokedex, Pokemon
 
 def clear_screen():
     """Clear the terminal screen"""
@@ -1,108 +1,82 @@
-import pandas as pd
+import csv
+
+import numpy as np
+
+INT_STAT_COLUMNS = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+AGAINST_COLUMNS = [
+    'against_bug', 'against_dark', 'against_dragon', 'against_electric', 'against_fairy',
+    'against_fight', 'against_fire', 'against_flying', 'against_ghost', 'against_grass',
+    'against_ground', 'against_ice', 'against_normal', 'against_poison', 'against_psychic',
+    'against_rock', 'against_steel', 'against_water'
+]
+
+# Every against_* value in the csv is one of these, so rows store 1-byte codes into it
+EFFECTIVENESS_LUT = np.array([0.0, 0.25, 0.5, 1.0, 2.0, 4.0], dtype=np.float32)
+
+
+def _effectiveness_codes(values: np.ndarray) -> np.ndarray:
+    """Map effectiveness multipliers to their uint8 index in EFFECTIVENESS_LUT"""
+    codes = np.searchsorted(EFFECTIVENESS_LUT, values).clip(0, len(EFFECTIVENESS_LUT) - 1)
+    if not np.array_equal(EFFECTIVENESS_LUT[codes], values):
+        raise ValueError("pokemon.csv has an effectiveness value outside EFFECTIVENESS_LUT")
+    return codes.astype(np.uint8)
+
 
 class Pokemon:
-    def __init__(self, name: str):
-        self.name = name
-        self.abilities = abilities
-        self.type = type
-        self.hp = hp
-        self.attack = attack
-        self.defense = defense
-        self.special_attack = special_attack
-        self.special_defense = special_defense
-        self.speed = speed
-        self.against_bug = against_bug
-        self.against_dark = against_dark
-        self.against_dragon = against_dragon
-        self.against_electric = against_electric
-        self.against_fairy = against_fairy
-        self.against_fight = against_fight
-        self.against_fire = against_fire
-        self.against_flying = against_flying
-        self.against_ghost = against_ghost
-        self.against_grass = against_grass
-        self.against_ground = against_ground
-        self.against_ice = against_ice
-        self.against_normal = against_normal
-        self.against_poison = against_poison
-        self.against_psychic = against_psychic
-        self.against_rock = against_rock
-        self.against_steel = against_steel
-        self.against_water = against_water
+    """One Pokédex entry; fixed slots instead of a per-instance __dict__."""
 
-    def to_dict(self):
-        return {
-            'name': self.name,
-            'abilities': self.abilities,
-            'type': self.type,
-            'hp': self.hp,
-            'attack': self.attack,
-            'defense': self.defense,
-            'special_attack': self.special_attack,
-            'special_defense': self.special_defense,
-            'speed': self.speed,
-            'against_bug': self.against_bug,
-            'against_dark': self.against_dark,
-            'against_dragon': self.against_dragon,
-            'against_electric': self.against_electric,
-            'against_fairy': self.against_fairy,
-            'against_fight': self.against_fight,
-            'against_fire': self.against_fire,
-            'against_flying': self.against_flying,
-            'against_ghost': self.against_ghost,
-            'against_grass': self.against_grass,
-            'against_ground': self.against_ground,
-            'against_ice': self.against_ice,
-            'against_normal': self.against_normal,
-            'against_poison': self.against_poison,
-            'against_psychic': self.against_psychic,
-            'against_rock': self.against_rock,
-            'against_steel': self.against_steel,
-            'against_water': self.against_water
-        }
-        return Pokemon(self.name, self.abilities, self.type, self.hp, self.attack, self.defense, self.special_attack, self.special_defense, self.speed, 
-        self.against_bug, self.against_dark, self.against_dragon, self.against_electric, self.against_fairy, self.against_fight, self.against_fire, 
-        self.against_flying, self.against_ghost, self.against_grass, self.against_ground, self.against_ice, self.against_normal, self.against_poison, 
-        self.against_psychic, self.against_rock, self.against_steel, self.against_water)
+    __slots__ = ('name', 'abilities', 'type', 'hp', 'attack', 'defense', 'special_attack',
+                 'special_defense', 'speed', *AGAINST_COLUMNS)
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
 
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
 
 
 class Pokedex:
     def __init__(self):
-        self.pokedex = pd.read_csv('pokemon.csv')
-        self.pokedex = self.pokedex.set_index('name')
-        
+        with open('pokemon.csv', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+        col = {name: i for i, name in enumerate(header)}
+
+        def column(name):
+            i = col[name]
+            return [row[i] for row in rows]
+
+        # Column-wise (SoA) storage: one typed array per group of stats,
+        # plus a name -> row lookup, instead of a DataFrame queried per field
+        names = column('name')
+        self._idx = {name: i for i, name in enumerate(names)}
+        self._names = np.array(names, dtype=object)
+        self._abilities = np.array(column('abilities'), dtype=object)
+        self._type1 = np.array(column('type1'), dtype=object)
+        # Missing second types stay NaN, as pandas reported them
+        self._type2 = np.array([t or float('nan') for t in column('type2')], dtype=object)
+        # Narrow dtypes: stats fit in int16, effectiveness in a uint8 LUT code
+        self._int_stats = np.array([column(c) for c in INT_STAT_COLUMNS], dtype=np.int16).T.copy()
+        self._against = _effectiveness_codes(
+            np.array([column(c) for c in AGAINST_COLUMNS], dtype=np.float32).T.copy())
 
     def get_pokemon(self, name: str):
+        i = self._idx[name]
+        hp, attack, defense, sp_attack, sp_defense, speed = self._int_stats[i].tolist()
         pokemon = {
-            'name': self.pokedex.loc[name].name,
-            'abilities': self.pokedex.loc[name]['abilities'],
-            'type': [self.pokedex.loc[name]['type1'], self.pokedex.loc[name]['type2']],
-            'hp': self.pokedex.loc[name]['hp'], 
-            'attack': self.pokedex.loc[name]['attack'],
-            'defense': self.pokedex.loc[name]['defense'],
-            'special_attack': self.pokedex.loc[name]['sp_attack'],
-            'special_defense': self.pokedex.loc[name]['sp_defense'],
-            'speed': self.pokedex.loc[name]['speed'],
-            'against_bug': self.pokedex.loc[name]['against_bug'],
-            'against_dark': self.pokedex.loc[name]['against_dark'],
-            'against_dragon': self.pokedex.loc[name]['against_dragon'],
-            'against_electric': self.pokedex.loc[name]['against_electric'],
-            'against_fairy': self.pokedex.loc[name]['against_fairy'],
-            'against_fight': self.pokedex.loc[name]['against_fight'],
-            'against_fire': self.pokedex.loc[name]['against_fire'],
-            'against_flying': self.pokedex.loc[name]['against_flying'],
-            'against_ghost': self.pokedex.loc[name]['against_ghost'],
-            'against_grass': self.pokedex.loc[name]['against_grass'],
-            'against_ground': self.pokedex.loc[name]['against_ground'],
-            'against_ice': self.pokedex.loc[name]['against_ice'],
-            'against_normal': self.pokedex.loc[name]['against_normal'],
-            'against_poison': self.pokedex.loc[name]['against_poison'],
-            'against_psychic': self.pokedex.loc[name]['against_psychic'],
-            'against_rock': self.pokedex.loc[name]['against_rock'],
-            'against_steel': self.pokedex.loc[name]['against_steel'],
-            'against_water': self.pokedex.loc[name]['against_water']
+            'name': self._names[i],
+            'abilities': self._abilities[i],
+            'type': [self._type1[i], self._type2[i]],
+            'hp': hp,
+            'attack': attack,
+            'defense': defense,
+            'special_attack': sp_attack,
+            'special_defense': sp_defense,
+            'speed': speed,
         }
+        pokemon.update(zip(AGAINST_COLUMNS, EFFECTIVENESS_LUT[self._against[i]].tolist()))
         return pokemon
 
 
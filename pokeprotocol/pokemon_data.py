@@ -1,8 +1,9 @@
-import pandas as pd
-import numpy as np
+import functools
 import os
 from typing import Dict, List, Optional, Any, Tuple
 
+import pandas as pd
+
 # --- Type Effectiveness Data (Expanded Type Chart) ---
 # This dictionary defines what the ATTACKING type is effective against (DEFENDING type).
 TYPE_MULTIPLIERS = {
@@ -92,6 +93,23 @@ TYPE_MULTIPLIERS = {
     }
 }
 
+# Integer id per type; NO_TYPE stands for a missing or unknown type.
+TYPE_IDS = {type_name: i for i, type_name in enumerate(TYPE_MULTIPLIERS)}
+NO_TYPE = len(TYPE_IDS)
+
+# TYPE_CHART[attacking_id][defending_id] -> multiplier (the NO_TYPE row/column is neutral)
+TYPE_CHART = tuple(
+    tuple(TYPE_MULTIPLIERS[attacking].get(f"against_{defending}", 1.0) for defending in TYPE_IDS) + (1.0,)
+    for attacking in TYPE_IDS
+) + ((1.0,) * (NO_TYPE + 1),)
+
+
+def type_id(type_name: Optional[str]) -> int:
+    """Map a type name to its TYPE_CHART index."""
+    if not type_name:
+        return NO_TYPE
+    return TYPE_IDS.get(type_name.lower(), NO_TYPE)
+
 
 class Pokedex:
     """Manages loading and retrieval of Pokémon data using Pandas."""
@@ -138,80 +156,83 @@ class Pokedex:
         except Exception as e:
             print(f"Error loading Pokedex with Pandas: {e}")
             self.pokedex = pd.DataFrame()
-            
-    def _extract_pokemon_data(self, row: pd.Series) -> Dict[str, Any]:
-        """Extracts and cleans essential data from a single Pandas Series (row)."""
-        if row.empty:
-            return {}
-
-        # Safely convert to dictionary, handling missing values (NaN becomes None)
-        data = row.replace({np.nan: None}).to_dict()
-        
-        # Ensure critical keys exist and are standardized for battle system
-        pokemon_dict = {
-            'name': data.get('name', 'Unknown'),
-            'pokedex_number': int(data.get('pokedex_number', 0)),
-            # Use Type_1/Type_2 if the CSV headers weren't mapped correctly, but rely on mapping
-            'type1': data.get('type1', 'Normal'), 
-            'type2': data.get('type2', None),
-            
+
+        # Normalized dict per row (in row order), built once with column-wise
+        # conversions so lookups never convert a pandas row
+        self._records = self._build_records(self.pokedex)
+
+        # Lowercase name / Pokedex number -> row position (first row wins on duplicates)
+        self._name_index: Dict[str, int] = {}
+        self._number_index: Dict[int, int] = {}
+        if 'name_lower' in self.pokedex:
+            for pos, name in enumerate(self.pokedex['name_lower'].tolist()):
+                self._name_index.setdefault(name, pos)
+        if 'pokedex_number' in self.pokedex:
+            for pos, number in enumerate(self.pokedex['pokedex_number'].tolist()):
+                self._number_index.setdefault(number, pos)
+
+    @staticmethod
+    def _build_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Builds the battle-ready dict for every row using whole-column conversions."""
+        n = len(df)
+
+        def text(col: str, default: Any) -> List[Any]:
+            # Missing values (NaN) become None
+            if col not in df:
+                return [default] * n
+            return df[col].astype(object).where(df[col].notna(), None).tolist()
+
+        def ints(col: str, default: int) -> List[int]:
             # Core Stats - ensure they are integers for calculation
-            'hp': int(data.get('hp', 50)),
-            'attack': int(data.get('attack', 50)),
-            'defense': int(data.get('defense', 50)),
-            'special_attack': int(data.get('special_attack', 50)),
-            'special_defense': int(data.get('special_defense', 50)),
-            'speed': int(data.get('speed', 50)),
-            'abilities': data.get('abilities', '[]')
-            # The 'against_' keys are kept implicitly in 'data' but are not essential for core battle logic (type chart handles it)
+            if col not in df:
+                return [default] * n
+            return pd.to_numeric(df[col], errors='coerce').fillna(default).astype(int).tolist()
+
+        # Ensure critical keys exist and are standardized for battle system
+        columns = {
+            'name': text('name', 'Unknown'),
+            'pokedex_number': ints('pokedex_number', 0),
+            'type1': text('type1', 'Normal'),
+            # Clean up type2 if it's an empty string or 'None'
+            'type2': [None if t in ('', 'None') else t for t in text('type2', None)],
+            'hp': ints('hp', 50),
+            'attack': ints('attack', 50),
+            'defense': ints('defense', 50),
+            'special_attack': ints('special_attack', 50),
+            'special_defense': ints('special_defense', 50),
+            'speed': ints('speed', 50),
+            'abilities': text('abilities', '[]'),
+            # The 'against_' columns are not essential for core battle logic (type chart handles it)
         }
-        
-        # Clean up type2 if it's an empty string or 'None'
-        if pokemon_dict['type2'] in ('', 'None', None):
-            pokemon_dict['type2'] = None
-        
-        return pokemon_dict
-
-    def get_pokemon_by_name(self, name: str) -> Optional[Dict]:
-        """Retrieve Pokémon data by name."""
-        if self.pokedex.empty:
-            return None
-            
-        try:
-            # Look up by the standardized lowercase index
-            row = self.pokedex.loc[name.lower()]
-            
-            # If it returns a DataFrame (multiple matches), take the first one
-            if isinstance(row, pd.DataFrame):
-                row = row.iloc[0]
-                
-            return self._extract_pokemon_data(row)
-        except KeyError:
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+    def get_pokemon_by_name(self, name: str, copy: bool = True) -> Optional[Dict]:
+        """Retrieve Pokémon data by name (a copy; copy=False returns the shared record, read-only use only)."""
+        # Look up by the standardized lowercase name
+        pos = self._name_index.get(name.lower())
+        if pos is None:
             return None
+        record = self._records[pos]
+        return dict(record) if copy else record
 
-    def get_pokemon_by_number(self, number: int) -> Optional[Dict]:
-        """Retrieve Pokémon data by Pokedex number."""
-        if self.pokedex.empty:
+    def get_pokemon_by_number(self, number: int, copy: bool = True) -> Optional[Dict]:
+        """Retrieve Pokémon data by Pokedex number (a copy; copy=False returns the shared record, read-only use only)."""
+        # Empty if the 'pokedex_number' column is missing
+        pos = self._number_index.get(number)
+        if pos is None:
             return None
-        
-        try:
-            # Filter the DataFrame based on the 'pokedex_number' column
-            match = self.pokedex[self.pokedex['pokedex_number'] == number]
-            
-            if not match.empty:
-                return self._extract_pokemon_data(match.iloc[0])
-        except Exception:
-            pass # Ignore if the 'pokedex_number' column is missing/corrupted
-            
-        return None
+        record = self._records[pos]
+        return dict(record) if copy else record
 
-    def get_pokemon_list(self, limit: int = 6) -> List[Dict]:
-        """Returns a list of normalized Pokémon records for display."""
+    def get_pokemon_list(self, limit: int = 6, copy: bool = True) -> List[Dict]:
+        """Returns a list of normalized Pokémon records for display (copies unless copy=False)."""
         if self.pokedex.empty:
             return []
             
-        # Get the first 'limit' rows and extract data
-        return [self._extract_pokemon_data(row) for _, row in self.pokedex.head(limit).iterrows()]
+        # Get the first 'limit' rows (same slicing semantics as DataFrame.head)
+        records = self._records[:limit]
+        return [dict(record) for record in records] if copy else records
 
     # --- Type Effectiveness Calculation ---
 
@@ -220,31 +241,28 @@ class Pokedex:
         Calculates the damage multiplier for an attacking type against 
         a single or dual-type defender.
         """
+        effectiveness_row = TYPE_CHART[type_id(attacking_type)]
         final_multiplier = 1.0
-        attacking_type = attacking_type.lower()
-        
-        if attacking_type not in TYPE_MULTIPLIERS:
-            return 1.0
-            
-        attack_multipliers = TYPE_MULTIPLIERS[attacking_type]
-        
         for defender_type in defending_types:
-            if not defender_type:
-                continue
-                
-            defender_type = defender_type.lower()
-            
-            # The key in our lookup dictionary is formatted "against_type"
-            lookup_key = f"against_{defender_type}"
-            
-            # Get the specific multiplier for this interaction, default to 1.0 if not found
-            multiplier = attack_multipliers.get(lookup_key, 1.0)
-            
-            # Multiply the cumulative effectiveness
-            final_multiplier *= multiplier
-            
+            # Missing/unknown types map to the neutral NO_TYPE column
+            final_multiplier *= effectiveness_row[type_id(defender_type)]
         return final_multiplier
 
 
+@functools.lru_cache(maxsize=None)
+def get_pokemon_db() -> Pokedex:
+    """The shared Pokedex, loaded on first use."""
+    return Pokedex()
+
+
+class _LazyPokedex:
+    """Stands in for the shared Pokedex so importing this module doesn't load the csv."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_pokemon_db(), name)
+
+
 # Global instance for easy access in other modules (e.g., battle_system.py)
-pokemon_db = Pokedex()
\ No newline at end of file
+pokemon_db = _LazyPokedex()